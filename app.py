@@ -7,21 +7,20 @@ URL文本词频分析可视化系统
 4. Streamlit交互式界面（侧边栏图表筛选、低频词过滤）
 """
 
+import asyncio
+import multiprocessing
+import os
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
-import jieba
 import re
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from heapq import nlargest
+from operator import itemgetter
 # 引入自定义模块
 import crawler
 import text_proc
 
-# Pyecharts相关
-from pyecharts import options as opts
-from pyecharts.charts import WordCloud, Bar, Line, Pie, Radar, Scatter, HeatMap, TreeMap, Polar
-from streamlit_echarts import st_pyecharts
-
 # ---------------------- 页面配置 ----------------------
 st.set_page_config(
     page_title="URL文本词频分析系统",
@@ -31,7 +30,7 @@ st.set_page_config(
 
 # ---------------------- 全局常量 ----------------------
 # 中文停用词表（扩充版）
-STOP_WORDS = set([
+STOP_WORDS = frozenset([
     "的", "了", "在", "是", "我", "有", "和", "就", "不", "人", "都", "一", "一个", "上", "也",
     "很", "到", "说", "要", "去", "你", "会", "着", "没有", "看", "好", "自己", "这", "那",
     "他", "她", "它", "我们", "你们", "他们", "这里", "那里", "然后", "但是", "因为", "所以",
@@ -41,63 +40,291 @@ STOP_WORDS = set([
     "此", "该", "其", "或", "即", "因", "由", "及", "并", "个", "位", "件", "条", "本", "项"
 ])
 
+# 文本清洗正则（非中英文数字字符；parse_page返回的已是纯文本，无需再去除HTML标签）
+_CLEAN_RE = re.compile(r"[^\u4e00-\u9fa5a-zA-Z0-9]+")
+
 # ---------------------- 核心函数 ----------------------
-def fetch_url_all_text(url: str) -> str:
+@st.cache_resource(show_spinner=False)
+def get_io_executor():
+    """
+    后台写文件线程池（每个进程只创建一次；单线程保证多次保存按顺序写入同一文件）
+    :return: ThreadPoolExecutor
+    """
+    return ThreadPoolExecutor(max_workers=1)
+
+class FetchFailedError(Exception):
+    """
+    部分URL抓取失败（st.cache_data不缓存异常，下次点击分析时会重新抓取）
+    :param texts: 抓取成功的网页文本列表
+    :param errors: 抓取失败的提示信息列表
     """
-    抓取**整个网页**的所有文本内容（替代原文章详情页抓取逻辑）
-    :param url: 目标网页URL
-    :return: 网页所有可见文本内容
+    def __init__(self, texts: list, errors: list):
+        super().__init__("；".join(errors))
+        self.texts = texts
+        self.errors = errors
+
+# 相同输入直接命中缓存（1小时过期），避免重复抓取网页和重复分词
+# 只有全部URL抓取成功时才会缓存结果：有URL失败时抛出FetchFailedError，超时或5xx不会被缓存一小时
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_urls_all_text(urls: list) -> list:
+    """
+    并发抓取多个URL**整个网页**的所有文本内容
+    :param urls: 目标网页URL列表
+    :return: 各网页的可见文本内容列表（解析不到有效文本的网页不计入）
+    :raises FetchFailedError: 有URL抓取失败时抛出，异常中带有其余网页的文本
     """
-    try:
-        # 调用crawler.py的函数获取网页文本（统一爬取逻辑）
-        html_content = crawler.get_web_page(url)
+    # 调用crawler.py的异步函数并发获取所有网页源代码（总耗时≈最慢的单个请求）
+    html_list = asyncio.run(crawler.fetch_all_async(urls))
+    
+    texts = []
+    errors = []
+    for url, html_content in zip(urls, html_list):
         if not html_content:
-            st.error(f"无法获取{url}的网页内容")
-            return ""
+            errors.append(f"无法获取{url}的网页内容")
+            continue
         # 调用crawler.py的解析函数提取完整文本
         full_text = crawler.parse_page(html_content)
         if not full_text:
             st.warning(f"未从{url}中提取到有效文本")
-            return ""
-        return full_text
-    except Exception as e:
-        st.error(f"抓取{url}失败：{str(e)}")
-        return ""
+            continue
+        texts.append(full_text)
+    if errors:
+        raise FetchFailedError(texts, errors)
+    return texts
+
+def iter_valid_freq(word_freq: Counter, min_freq: int):
+    """
+    按最小词频过滤的词频视图（惰性遍历，不生成新的Counter）
+    :param word_freq: 完整词频
+    :param min_freq: 最小词频阈值
+    :return: 满足阈值的(词汇, 词频)迭代器
+    """
+    return ((word, freq) for word, freq in word_freq.items() if freq >= min_freq)
 
-def process_text_for_freq(text: str, min_freq: int) -> tuple:
+def compute_full_freq(word_freq: Counter, min_freq: int) -> dict:
     """
-    文本处理与词频统计（整合text_proc.py的逻辑）
-    :param text: 原始文本
+    生成满足最小词频的完整词频（仅保存结果时才需要）
+    :param word_freq: 完整词频
     :param min_freq: 最小词频阈值
-    :return: (top20_words, word_freq)
+    :return: {词汇: 词频}
+    """
+    return dict(iter_valid_freq(word_freq, min_freq))
+
+# 分词与计数与min_freq无关：只按文本缓存，调整最小词频时不会重新分词
+@st.cache_data(ttl=3600, show_spinner=False)
+def count_word_freq(texts: list, use_hmm: bool) -> Counter:
+    """
+    对各网页文本分别分词并统计词频，再合并
+    :param texts: 各网页的原始文本列表
+    :param use_hmm: 是否启用HMM新词发现（关闭时跳过Viterbi计算，分词更快）
+    :return: 所有有效词汇的完整词频（未按min_freq过滤）
+    """
+    # 去除标点符号等非中英文数字字符（单次正则替换）
+    clean_texts = [_CLEAN_RE.sub(" ", text) for text in texts]
+    # 各网页文本相互独立：文本总量足够大时才用多进程并行分词（绕开GIL）
+    # 普通网页只有几KB到几十KB，进程池的启动开销远大于分词本身，直接串行分词
+    processes = min(len(clean_texts), os.cpu_count() or 1)
+    if processes > 1 and sum(map(len, clean_texts)) >= text_proc.PARALLEL_MIN_CHARS:
+        with multiprocessing.Pool(processes) as pool:
+            counters = pool.starmap(
+                text_proc.tokenize_and_count,
+                [(text, STOP_WORDS, use_hmm) for text in clean_texts]
+            )
+    else:
+        counters = [text_proc.tokenize_and_count(text, STOP_WORDS, use_hmm) for text in clean_texts]
+    # 合并各网页的词频
+    word_counter = Counter()
+    for counter in counters:
+        word_counter.update(counter)
+    return word_counter
+
+def process_text_for_freq(texts: list, min_freq: int, use_hmm: bool) -> tuple:
+    """
+    文本处理与词频统计（分词结果走缓存，仅按min_freq重新筛选）
+    :param texts: 各网页的原始文本列表
+    :param min_freq: 最小词频阈值
+    :param use_hmm: 是否启用HMM新词发现
+    :return: (top20_words, word_freq, valid_word_count)，word_freq为未按min_freq过滤的完整词频，
+             valid_word_count为满足min_freq的词汇数
+    """
+    word_counter = count_word_freq(texts, use_hmm)
+    # 单次遍历筛出满足阈值的词汇，同时用于选出前20和统计有效词汇数，不删除/重建Counter
+    valid_items = list(iter_valid_freq(word_counter, min_freq))
+    top20_words = nlargest(20, valid_items, key=itemgetter(1))
+    return top20_words, word_counter, len(valid_items)
+
+# ---------------------- 图表构建函数 ----------------------
+# Pyecharts在构建函数内按需导入：页面首次渲染图表时才加载，打开页面/输入URL时无需导入
+# 图表对象按输入数据缓存：切换图表或页面重新运行时，已构建过的图表不再重复生成配置
+_chart_cache = st.cache_resource(ttl=3600, max_entries=20, show_spinner=False)
+
+@_chart_cache
+def build_wordcloud(words: tuple, freqs: tuple):
+    """构建词云图"""
+    from pyecharts import options as opts
+    from pyecharts.charts import WordCloud
+    return (
+        WordCloud()
+        .add("", list(zip(words, freqs)), word_size_range=[20, 100], shape="circle")
+        .set_global_opts(title_opts=opts.TitleOpts(title="文本词云图", pos_left="center"))
+    )
+
+@_chart_cache
+def build_bar(words: tuple, freqs: tuple):
+    """构建词频前20柱状图"""
+    from pyecharts import options as opts
+    from pyecharts.charts import Bar
+    return (
+        Bar()
+        .add_xaxis(list(words))
+        .add_yaxis("词频", list(freqs))
+        .reversal_axis()
+        .set_global_opts(
+            title_opts=opts.TitleOpts(title="词频前20柱状图", pos_left="center"),
+            xaxis_opts=opts.AxisOpts(name="词频"),
+            yaxis_opts=opts.AxisOpts(name="词汇")
+        )
+    )
+
+@_chart_cache
+def build_line(words: tuple, freqs: tuple):
+    """构建词频前20折线图"""
+    from pyecharts import options as opts
+    from pyecharts.charts import Line
+    return (
+        Line()
+        .add_xaxis(list(words))
+        .add_yaxis("词频", list(freqs), is_smooth=True)
+        .set_global_opts(
+            title_opts=opts.TitleOpts(title="词频前20折线图", pos_left="center"),
+            xaxis_opts=opts.AxisOpts(axislabel_opts=opts.LabelOpts(rotate=-30))
+        )
+    )
+
+@_chart_cache
+def build_pie(words: tuple, freqs: tuple):
+    """构建词频前20饼图"""
+    from pyecharts import options as opts
+    from pyecharts.charts import Pie
+    return (
+        Pie()
+        .add("", list(zip(words, freqs)))
+        .set_global_opts(title_opts=opts.TitleOpts(title="词频前20饼图", pos_left="center"))
+        .set_series_opts(label_opts=opts.LabelOpts(formatter="{b}: {c}"))
+    )
+
+@_chart_cache
+def build_radar(words: tuple, freqs: tuple):
+    """构建词频前10雷达图"""
+    from pyecharts import options as opts
+    from pyecharts.charts import Radar
+    radar_words = words[:10]
+    radar_freq = list(freqs[:10])
+    # 各维度共用同一最大值，只计算一次（原写法在列表推导式中每个词都重新求max）
+    radar_max = max(radar_freq)
+    return (
+        Radar()
+        .add_schema(schema=[opts.RadarIndicatorItem(name=word, max_=radar_max) for word in radar_words])
+        .add("词频", [radar_freq])
+        .set_global_opts(title_opts=opts.TitleOpts(title="词频前10雷达图", pos_left="center"))
+    )
+
+@_chart_cache
+def build_scatter(words: tuple, freqs: tuple):
+    """构建词频前20散点图"""
+    from pyecharts import options as opts
+    from pyecharts.charts import Scatter
+    return (
+        Scatter()
+        .add_xaxis(list(words))
+        .add_yaxis("词频", list(freqs))
+        .set_global_opts(
+            title_opts=opts.TitleOpts(title="词频前20散点图", pos_left="center"),
+            xaxis_opts=opts.AxisOpts(axislabel_opts=opts.LabelOpts(rotate=-30))
+        )
+    )
+
+@_chart_cache
+def build_heatmap(words: tuple, freqs: tuple):
+    """构建词频前20热力图"""
+    from pyecharts import options as opts
+    from pyecharts.charts import HeatMap
+    heatmap_data = [[0, idx, freq] for idx, freq in enumerate(freqs)]
+    freq_min, freq_max = min(freqs), max(freqs)
+    return (
+        HeatMap()
+        .add_xaxis(list(words))
+        .add_yaxis("词频", [" "], heatmap_data)
+        .set_global_opts(
+            title_opts=opts.TitleOpts(title="词频前20热力图", pos_left="center"),
+            visualmap_opts=opts.VisualMapOpts(min_=freq_min, max_=freq_max)
+        )
+    )
+
+@_chart_cache
+def build_treemap(words: tuple, freqs: tuple):
+    """构建词频前20树状图"""
+    from pyecharts import options as opts
+    from pyecharts.charts import TreeMap
+    treemap_data = [{"name": k, "value": v} for k, v in zip(words, freqs)]
+    return (
+        TreeMap()
+        .add("", treemap_data)
+        .set_global_opts(title_opts=opts.TitleOpts(title="词频前20树状图", pos_left="center"))
+        .set_series_opts(label_opts=opts.LabelOpts(formatter="{b}: {c}"))
+    )
+
+@_chart_cache
+def build_polar(words: tuple, freqs: tuple):
+    """构建词频前10极坐标图"""
+    from pyecharts import options as opts
+    from pyecharts.charts import Polar
+    return (
+        Polar()
+        .add_schema(angleaxis_opts=opts.AngleAxisOpts(data=list(words[:10]), type_="category"))
+        .add("词频", list(freqs[:10]), type_="bar")
+        .set_global_opts(title_opts=opts.TitleOpts(title="词频前10极坐标图", pos_left="center"))
+    )
+
+def render_chart(chart, height: str):
     """
-    # 调用text_proc.py的清洗函数
-    text_without_html = text_proc.remove_html_tags(text)
-    clean_text = text_proc.remove_punctuation(text_without_html)
-    # 分词（加入停用词过滤）
-    words = jieba.lcut(clean_text)
-    valid_words = [
-        word for word in words
-        if len(word) > 1 
-        and word not in STOP_WORDS 
-        and not word.isdigit()
-    ]
-    # 统计词频
-    word_counter = Counter(valid_words)
-    filtered_counter = Counter({k: v for k, v in word_counter.items() if v >= min_freq})
-    top20_words = filtered_counter.most_common(20)
-    return top20_words, filtered_counter
+    在页面中渲染Pyecharts图表（等价于st_pyecharts，但用orjson完成图表配置的序列化与反序列化）
+    :param chart: Pyecharts图表对象
+    :param height: 图表高度
+    """
+    import orjson
+    from pyecharts.charts.base import default
+    from streamlit_echarts import st_echarts
+    # st_pyecharts内部用simplejson对图表配置做一次dumps+loads，词云图词汇量大时是主要耗时
+    options = orjson.loads(orjson.dumps(
+        chart.get_options(),
+        default=default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ))
+    st_echarts(options=options, width="100%", height=height)
+
+# 图表类型 -> (构建函数, 图表高度)
+CHART_BUILDERS = {
+    "词云图": (build_wordcloud, "500px"),
+    "词频前20柱状图": (build_bar, "500px"),
+    "词频前20折线图": (build_line, "500px"),
+    "词频前20饼图": (build_pie, "500px"),
+    "词频雷达图": (build_radar, "500px"),
+    "词频散点图": (build_scatter, "500px"),
+    "词频热力图": (build_heatmap, "300px"),
+    "词频树状图": (build_treemap, "500px"),
+    "词频极坐标图": (build_polar, "500px"),
+}
 
 # ---------------------- 侧边栏：图表筛选 ----------------------
 st.sidebar.title("📊 可视化图表筛选")
 chart_type = st.sidebar.selectbox(
     "选择图表类型",
-    options=[
-        "词云图", "词频前20柱状图", "词频前20折线图", "词频前20饼图",
-        "词频雷达图", "词频散点图", "词频热力图", "词频树状图", "词频极坐标图"
-    ],
+    options=list(CHART_BUILDERS),
     index=0
 )
+# 单字词和停用词会被过滤，HMM发现的新词对前20结果影响很小，默认关闭以加快分词
+use_hmm = st.sidebar.checkbox("启用HMM新词发现（较慢）", value=False)
 
 # ---------------------- 主页面：输入与分析 ----------------------
 st.title("🔍 URL文本词频分析可视化系统")
@@ -119,38 +346,60 @@ min_freq = st.slider("过滤低频词（最小词频）", min_value=1, max_value
 
 # 3. 分析按钮
 if st.button("🚀 开始分析", type="primary"):
-    # 过滤空URL
-    valid_urls = [url.strip() for url in urls if url.strip()]
+    # 过滤空URL、去掉#锚点并去重
+    valid_urls = crawler.dedupe_urls(url.strip() for url in urls if url.strip())
+    texts, fetch_errors = [], []
+    if valid_urls:
+        with st.spinner("正在抓取网页..."):
+            # 并发抓取所有URL的文本（抓取失败不会被缓存，仍用抓取成功的网页继续分析）
+            try:
+                texts = fetch_urls_all_text(valid_urls)
+            except FetchFailedError as e:
+                texts, fetch_errors = e.texts, e.errors
+            except Exception as e:
+                fetch_errors = [f"批量抓取失败：{str(e)}"]
+    # 只在点击分析时抓取一次，抓取结果记录在session_state中
+    # 切换图表、调整阈值或保存结果时直接复用，即使有URL抓取失败也不会重新下载所有网页
+    st.session_state["analyzed_urls"] = valid_urls
+    st.session_state["fetched_texts"] = texts
+    st.session_state["fetch_errors"] = fetch_errors
+
+if "analyzed_urls" in st.session_state:
+    valid_urls = st.session_state["analyzed_urls"]
     if not valid_urls:
         st.warning("请输入至少一个有效的URL")
     else:
-        with st.spinner("正在抓取网页并分析..."):
-            # 批量抓取所有URL的文本
-            all_text = ""
-            for url in valid_urls:
-                text = fetch_url_all_text(url)
-                all_text += text + "\n"
+        with st.spinner("正在分析..."):
+            texts = st.session_state["fetched_texts"]
+            for error in st.session_state["fetch_errors"]:
+                st.error(error)
             
-            if not all_text.strip():
+            if not texts:
                 st.warning("未抓取到任何有效文本")
                 st.stop()
             
             # 处理文本并统计词频
-            top20_words, word_freq = process_text_for_freq(all_text, min_freq)
+            top20_words, word_freq, valid_word_count = process_text_for_freq(texts, min_freq, use_hmm)
             
-            if not word_freq:
+            if not top20_words:
                 st.warning(f"无满足最小词频{min_freq}的词汇，请降低阈值")
                 st.stop()
             
-            # 调用text_proc.py保存词频结果
-            text_proc.save_word_freq_to_file(dict(word_freq), top20_words)
-            
             # 提取数据用于可视化
             top20_words_list = [word for word, freq in top20_words]
             top20_freq_list = [freq for word, freq in top20_words]
 
             # ---------------------- 结果展示 ----------------------
-            st.success(f"✅ 分析完成！共抓取{len(valid_urls)}个网页，统计到{len(word_freq)}个有效词汇")
+            st.success(f"✅ 分析完成！共抓取{len(valid_urls)}个网页，统计到{valid_word_count}个有效词汇")
+            
+            # 按需调用text_proc.py保存词频结果（后台线程写文件，不阻塞图表渲染）
+            if st.button("💾 保存词频结果到words.txt"):
+                get_io_executor().submit(
+                    text_proc.save_word_freq_to_file,
+                    compute_full_freq(word_freq, min_freq),
+                    top20_words
+                )
+                st.info("词频结果正在后台保存到words.txt")
             
             # 分两列展示：词频排名 + 图表
             col1, col2 = st.columns([1, 2])
@@ -162,109 +411,14 @@ if st.button("🚀 开始分析", type="primary"):
             
             with col2:
                 st.markdown(f"### 📊 {chart_type}")
-                # 根据选择的图表类型生成对应图表
+                # 只有词云图需要完整词频，其余图表只用前20
                 if chart_type == "词云图":
-                    wordcloud_data = list(word_freq.items())
-                    wc = (
-                        WordCloud()
-                        .add("", wordcloud_data, word_size_range=[20, 100], shape="circle")
-                        .set_global_opts(title_opts=opts.TitleOpts(title="文本词云图", pos_left="center"))
-                    )
-                    st_pyecharts(wc, width="100%", height="500px")
-                
-                elif chart_type == "词频前20柱状图":
-                    bar = (
-                        Bar()
-                        .add_xaxis(top20_words_list)
-                        .add_yaxis("词频", top20_freq_list)
-                        .reversal_axis()
-                        .set_global_opts(
-                            title_opts=opts.TitleOpts(title="词频前20柱状图", pos_left="center"),
-                            xaxis_opts=opts.AxisOpts(name="词频"),
-                            yaxis_opts=opts.AxisOpts(name="词汇")
-                        )
-                    )
-                    st_pyecharts(bar, width="100%", height="500px")
-                
-                elif chart_type == "词频前20折线图":
-                    line = (
-                        Line()
-                        .add_xaxis(top20_words_list)
-                        .add_yaxis("词频", top20_freq_list, is_smooth=True)
-                        .set_global_opts(
-                            title_opts=opts.TitleOpts(title="词频前20折线图", pos_left="center"),
-                            xaxis_opts=opts.AxisOpts(axislabel_opts=opts.LabelOpts(rotate=-30))
-                        )
-                    )
-                    st_pyecharts(line, width="100%", height="500px")
-                
-                elif chart_type == "词频前20饼图":
-                    pie = (
-                        Pie()
-                        .add("", top20_words)
-                        .set_global_opts(title_opts=opts.TitleOpts(title="词频前20饼图", pos_left="center"))
-                        .set_series_opts(label_opts=opts.LabelOpts(formatter="{b}: {c}"))
-                    )
-                    st_pyecharts(pie, width="100%", height="500px")
-                
-                elif chart_type == "词频雷达图":
-                    radar_words = top20_words_list[:10]
-                    radar_freq = top20_freq_list[:10]
-                    if radar_freq:
-                        radar = (
-                            Radar()
-                            .add_schema(schema=[opts.RadarIndicatorItem(name=word, max_=max(radar_freq)) for word in radar_words])
-                            .add("词频", [radar_freq])
-                            .set_global_opts(title_opts=opts.TitleOpts(title="词频前10雷达图", pos_left="center"))
-                        )
-                        st_pyecharts(radar, width="100%", height="500px")
-                
-                elif chart_type == "词频散点图":
-                    scatter = (
-                        Scatter()
-                        .add_xaxis(top20_words_list)
-                        .add_yaxis("词频", top20_freq_list)
-                        .set_global_opts(
-                            title_opts=opts.TitleOpts(title="词频前20散点图", pos_left="center"),
-                            xaxis_opts=opts.AxisOpts(axislabel_opts=opts.LabelOpts(rotate=-30))
-                        )
-                    )
-                    st_pyecharts(scatter, width="100%", height="500px")
-                
-                elif chart_type == "词频热力图":
-                    heatmap_data = [[0, idx, freq] for idx, freq in enumerate(top20_freq_list)]
-                    heatmap = (
-                        HeatMap()
-                        .add_xaxis(top20_words_list)
-                        .add_yaxis("词频", [" "], heatmap_data)
-                        .set_global_opts(
-                            title_opts=opts.TitleOpts(title="词频前20热力图", pos_left="center"),
-                            visualmap_opts=opts.VisualMapOpts(min_=min(top20_freq_list), max_=max(top20_freq_list))
-                        )
-                    )
-                    st_pyecharts(heatmap, width="100%", height="300px")
-                
-                elif chart_type == "词频树状图":
-                    treemap_data = [{"name": k, "value": v} for k, v in top20_words]
-                    treemap = (
-                        TreeMap()
-                        .add("", treemap_data)
-                        .set_global_opts(title_opts=opts.TitleOpts(title="词频前20树状图", pos_left="center"))
-                        .set_series_opts(label_opts=opts.LabelOpts(formatter="{b}: {c}"))
-                    )
-                    st_pyecharts(treemap, width="100%", height="500px")
-                
-                elif chart_type == "词频极坐标图":
-                    polar_words = top20_words_list[:10]
-                    polar_freq = top20_freq_list[:10]
-                    if polar_freq:
-                        polar = (
-                            Polar()
-                            .add_schema(angleaxis_opts=opts.AngleAxisOpts(data=polar_words, type_="category"))
-                            .add("词频", polar_freq, type_="bar")
-                            .set_global_opts(title_opts=opts.TitleOpts(title="词频前10极坐标图", pos_left="center"))
-                        )
-                        st_pyecharts(polar, width="100%", height="500px")
+                    chart_words, chart_freqs = zip(*iter_valid_freq(word_freq, min_freq))
+                else:
+                    chart_words, chart_freqs = tuple(top20_words_list), tuple(top20_freq_list)
+                # 根据选择的图表类型获取对应图表（相同数据直接复用已构建的图表）
+                build_chart, chart_height = CHART_BUILDERS[chart_type]
+                render_chart(build_chart(chart_words, chart_freqs), chart_height)
 
 # ---------------------- 侧边栏说明 ----------------------
 st.sidebar.markdown("---")
@@ -272,4 +426,5 @@ st.sidebar.markdown("#### 📝 使用说明")
 st.sidebar.markdown("1. 输入**任意网页URL**（支持多个URL批量分析）")
 st.sidebar.markdown("2. 调整滑动条设置最小词频阈值")
 st.sidebar.markdown("3. 点击「开始分析」查看整站文本的词频结果")
-st.sidebar.markdown("4. 侧边栏切换不同图表类型")
\ No newline at end of file
+st.sidebar.markdown("4. 侧边栏切换不同图表类型")
+st.sidebar.markdown("5. 如需保留结果，点击「保存词频结果」写入words.txt")
\ No newline at end of file
@@ -1,6 +1,99 @@
+import asyncio
+import codecs
+import re
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.parser import HTMLParser
 import time
+from urllib.parse import urldefrag
+
+# 请求头（同步/异步抓取共用）
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'zh-CN,zh;q=0.9',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive'
+}
+
+# 复用同一会话（连接池 + keep-alive），同一站点的后续请求无需重新握手
+_SESSION = None
+
+def _get_session():
+    """
+    首次调用时创建带连接池和重试的requests会话，之后直接复用
+    :return: requests.Session
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        _SESSION.headers.update(HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        _SESSION.mount('https://', adapter)
+        _SESSION.mount('http://', adapter)
+    return _SESSION
+
+# 新增：URL预处理（去掉#锚点并去重，同一网页只请求一次）
+def dedupe_urls(urls):
+    """
+    去除URL中的#片段（HTTP请求不会发送片段）并按原顺序去重
+    :param urls: URL列表
+    :return: 去重后的URL列表
+    """
+    return list(dict.fromkeys(urldefrag(url).url for url in urls))
+
+# 响应头Content-Type与网页<meta>中声明的字符集
+_HEADER_CHARSET_RE = re.compile(r'charset=["\']?([\w-]+)', re.I)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+# 服务器常用的默认声明（单字节编码解码从不失败，按它解码UTF-8/GBK网页会得到乱码），响应头中的这类声明视为未声明
+_UNRELIABLE_HEADER_CODECS = frozenset(['iso8859-1', 'ascii', 'cp1252'])
+
+def _charset_from_content_type(content_type):
+    """
+    从Content-Type响应头中取出声明的字符集
+    :param content_type: Content-Type响应头（可为None）
+    :return: 字符集名称（str）/ None（未声明）
+    """
+    match = _HEADER_CHARSET_RE.search(content_type or '')
+    return match.group(1) if match else None
+
+# 将响应字节解码为文本（优先使用声明的字符集，未声明或无效时按UTF-8、GBK依次尝试，避免chardet全文检测）
+def _decode_html(raw, charset=None):
+    """
+    按声明的字符集解码网页字节，失败时依次回退到UTF-8和GBK
+    :param raw: 网页源代码字节（bytes）
+    :param charset: 响应头声明的字符集，默认None（此时只检查网页开头的<meta>声明）
+    :return: 网页源代码（str）
+    """
+    if charset:
+        try:
+            if codecs.lookup(charset).name in _UNRELIABLE_HEADER_CODECS:
+                charset = None
+        except LookupError:
+            # 无效的字符集名称，同样视为未声明
+            charset = None
+    if not charset:
+        # <meta charset>按规范须出现在文档开头，只检查前2KB
+        match = _META_CHARSET_RE.search(raw, 0, 2048)
+        if match:
+            charset = match.group(1).decode('ascii')
+    if charset:
+        # 声明为GB2312的网页常含GBK字符，按其超集GBK解码
+        if charset.lower() == 'gb2312':
+            charset = 'gbk'
+        try:
+            return raw.decode(charset)
+        except (LookupError, UnicodeDecodeError):
+            pass
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode('gbk', errors='replace')
 
 # 步骤1：发送请求，获取网页源代码
 def get_web_page(url):
@@ -9,18 +102,12 @@ def get_web_page(url):
     :param url: 目标网页URL
     :return: 网页源代码（str）/ None（请求失败）
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept-Language': 'zh-CN,zh;q=0.9',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive'
-    }
     try:
-        response = requests.get(url, headers=headers, timeout=15)
+        response = _get_session().get(url, timeout=15)
         response.raise_for_status()
-        # 强制使用UTF-8编码（避免乱码）
-        response.encoding = response.apparent_encoding or 'utf-8'
-        return response.text
+        # 按响应头声明的字符集解码原始字节，跳过requests的apparent_encoding（chardet）检测
+        charset = _charset_from_content_type(response.headers.get('Content-Type'))
+        return _decode_html(response.content, charset)
     except requests.exceptions.ConnectTimeout:
         print(f"错误：连接{url}超时！请检查网络或URL有效性")
         return None
@@ -34,6 +121,47 @@ def get_web_page(url):
         print(f"未知错误：{e}")
         return None
 
+# 新增：并发获取多个网页源代码（供app.py调用，总耗时≈最慢的单个请求）
+async def _fetch_one_async(session, url):
+    """
+    在共享会话中异步获取单个网页源代码
+    :param session: aiohttp.ClientSession
+    :param url: 目标网页URL
+    :return: 网页源代码（str）/ None（请求失败）
+    """
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return _decode_html(await response.read(), response.charset)
+    except asyncio.TimeoutError:
+        print(f"错误：连接{url}超时！请检查网络或URL有效性")
+        return None
+    except aiohttp.ClientResponseError as e:
+        print(f"错误：{url}返回HTTP错误 {e.status}")
+        return None
+    except aiohttp.ClientError as e:
+        print(f"请求失败：{e}")
+        return None
+
+async def fetch_all_async(urls):
+    """
+    使用同一个aiohttp会话并发获取多个网页源代码
+    :param urls: URL列表
+    :return: 与urls一一对应的网页源代码列表（请求失败的位置为None）
+    """
+    timeout = aiohttp.ClientTimeout(total=15)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+        tasks = [_fetch_one_async(session, url) for url in urls]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    html_list = []
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"未知错误：{result}")
+            result = None
+        html_list.append(result)
+    return html_list
+
 # 步骤2：解析网页，提取**整个网页**的所有纯文本（关键修改）
 def parse_page(html):
     """
@@ -44,21 +172,19 @@ def parse_page(html):
     if not html:
         return None
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        # 使用C实现的selectolax解析（比BeautifulSoup的纯Python解析器快得多）
+        tree = HTMLParser(html)
         
-        # 移除无关标签（避免抓取无效文本）
-        for tag in soup(["script", "style", "noscript", "iframe", "header", "footer"]):
-            tag.extract()
+        # 移除无关标签（避免抓取无效文本），在C层按标签名批量删除，不逐个创建Python节点对象
+        tree.strip_tags(["script", "style", "noscript", "iframe", "header", "footer"], recursive=True)
         
         # 提取**所有标签**的文本（覆盖整站内容：导航、正文、侧边栏等）
-        all_text = soup.get_text(separator='\n', strip=True)
+        root = tree.body if tree.body is not None else tree.root
+        all_text = root.text(separator='\n', strip=True)
         
-        # 过滤空行和重复行，精简文本
-        lines = []
-        for line in all_text.split('\n'):
-            stripped_line = line.strip()
-            if stripped_line and stripped_line not in lines:
-                lines.append(stripped_line)
+        # 过滤空行和重复行，精简文本（dict保持插入顺序，线性时间去重）
+        stripped_lines = (line.strip() for line in all_text.split('\n'))
+        lines = dict.fromkeys(line for line in stripped_lines if line)
         
         final_text = '\n'.join(lines)
         
@@ -93,9 +219,10 @@ def save_data(text_content, file_num):
 # 新增：批量爬取并保存的公开函数（供app.py调用）
 def crawl_and_save(target_urls):
     """
-    批量爬取URL并保存为newX.txt
+    批量爬取URL并保存为newX.txt（仅#锚点不同的URL视为同一网页，只爬取一次）
     :param target_urls: URL列表
     """
+    target_urls = dedupe_urls(target_urls)
     for idx, url in enumerate(target_urls, start=1):
         print(f"\n========== 处理第{idx}个页面 ==========")
         print(f"目标URL：{url}")
@@ -1,74 +1,190 @@
+import mmap
+import os
 import re
-import jieba
+try:
+    # 优先使用C加速的jieba_fast（接口与jieba一致），未安装时回退到jieba
+    import jieba_fast as jieba
+except ImportError:
+    import jieba
 from collections import Counter
+from heapq import nlargest
+from itertools import starmap
+from multiprocessing import Pool
+from operator import itemgetter
+from pathlib import Path
+
+# 新增：导入时即加载分词词典（避免首次分词时才加载而阻塞请求）
+# jieba默认会把前缀词典缓存到系统临时目录，重启后直接读取缓存
+jieba.initialize()
 
 # 新增：停用词表（与app.py保持一致，增强过滤效果）
-STOP_WORDS = set([
+STOP_WORDS = frozenset([
     "的", "了", "在", "是", "我", "有", "和", "就", "不", "人", "都", "一", "一个", "上", "也",
     "很", "到", "说", "要", "去", "你", "会", "着", "没有", "看", "好", "自己", "这", "那"
 ])
 
+# 预编译正则表达式（模块加载时编译一次，避免每次调用重复编译）
+# [^>]*一次扫描到下一个'>'，无需像非贪婪的<.*?>那样逐字符回溯尝试；[^>]本身可匹配换行，无需re.S
+_HTML_RE = re.compile(r'<[^>]*>')
+# 字节版本：直接在内存映射的文件内容上去除标签（'<'、'>'为ASCII，不会出现在UTF-8多字节字符中）
+_HTML_BYTES_RE = re.compile(rb'<[^>]*>')
+# 标点符号与空白放在同一个字符类中，连续的标点/空白一次替换为单个空格
+_CLEAN_RE = re.compile(
+    r'[\u3000-\u303f\u2000-\u206f\u0021-\u002f\u003a-\u0040\u005b-\u0060\u007b-\u007e\uff01-\uff1f\s]+'
+)
+
+# 新增：启用多进程分词的最小文本量（字符数）
+# 进程池启动有固定开销（spawn方式下每个子进程还要重新加载jieba词典，约需数秒），文本较少时串行分词更快
+PARALLEL_MIN_CHARS = 1_000_000
+
+# 预先绑定的行格式化方法（保存词频时逐行调用，省去每行的格式串解析与属性查找）
+_TOP_ROW_FMT = "{:<6}{:<12}{:<8}\n".format
+_ROW_FMT = "{:<12}{:<8}\n".format
+
 # 1. 读取文本文件（支持读取单个或多个new系列文本文件）
+def read_text_file(num, strip_html=False):
+    """
+    读取单个new{num}.txt文件
+    :param num: 文件编号
+    :param strip_html: 是否在解码前去除HTML标签，默认False
+    :return: 文件文本内容（str）/ None（读取失败）
+    """
+    file_path = Path(f"new{num}.txt")
+    # 先检查文件是否存在，缺失文件不走异常处理流程；异常只留给真正意外的IO错误
+    if not file_path.is_file():
+        print(f"警告：未找到文件 {file_path}，跳过该文件")
+        return None
+    try:
+        # 内存映射文件后直接UTF-8解码，省去f.read()生成的整份bytes副本
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap不能映射空文件
+                text = ""
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if strip_html:
+                        # 在映射内容上去除标签，只解码去标签后的结果
+                        text = _HTML_BYTES_RE.sub(b'', mm).decode('utf-8')
+                    else:
+                        text = str(mm, 'utf-8')
+        print(f"成功读取：{file_path}")
+        return text
+    except Exception as e:
+        print(f"读取{file_path}失败：{e}，跳过该文件")
+    return None
+
 def read_text_files(file_nums=[1, 2, 3]):
     """
     读取new1.txt、new2.txt、new3.txt文件（整站爬取的结果）
     :param file_nums: 文件编号列表，默认[1,2,3]
     :return: 合并后的所有文本内容（str）
     """
-    total_text = ""
+    # 先收集各文件文本，最后一次性拼接（避免循环中反复拼接字符串）
+    chunks = []
     for num in file_nums:
-        file_path = f"new{num}.txt"
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            total_text += text + "\n"
-            print(f"成功读取：{file_path}")
-        except FileNotFoundError:
-            print(f"警告：未找到文件 {file_path}，跳过该文件")
-        except Exception as e:
-            print(f"读取{file_path}失败：{e}，跳过该文件")
-    return total_text
+        text = read_text_file(num)
+        if text is not None:
+            chunks.append(text)
+    return "\n".join(chunks)
+
+# 新增：读取单个文件并去除HTML标签和标点（供_count_one按文件调用）
+def _read_clean_text(num):
+    """
+    读取new{num}.txt并清洗
+    :param num: 文件编号
+    :return: 清洗后的文本（str）/ None（读取失败）
+    """
+    text = read_text_file(num, strip_html=True)
+    if text:
+        # 重新绑定同一名称，返回前就释放去标签后的中间文本，内存中只保留清洗后的一份
+        text = remove_punctuation(text)
+    return text
 
 # 2. 使用正则表达式去除HTML标签（兼容残留标签）
 def remove_html_tags(text):
     """去除文本中所有HTML标签（包括跨行标签）"""
-    html_pattern = re.compile(r'<.*?>', re.S)
-    clean_text = html_pattern.sub('', text)
-    return clean_text
+    return _HTML_RE.sub('', text)
 
 # 3. 去除文本中的标点符号（中英文标点全覆盖）
 def remove_punctuation(text):
-    """去除中英文标点符号、多余空格和换行符"""
-    punctuation_pattern = re.compile(
-        r'[\u3000-\u303f\u2000-\u206f\u0021-\u002f\u003a-\u0040\u005b-\u0060\u007b-\u007e\uff01-\uff1f\uff0c-\uff1a\uff1b\uff0e\uff1f\uff01]'
-    )
-    text_without_punc = punctuation_pattern.sub('', text)
-    text_without_punc = re.sub(r'\s+', ' ', text_without_punc).strip()
-    return text_without_punc
+    """去除中英文标点符号、多余空格和换行符（标点与空白一样视为词语边界）"""
+    return _CLEAN_RE.sub(' ', text).strip()
+
+# 新增：单段文本分词并统计有效词频（模块级函数，可供app.py多进程并行调用）
+def tokenize_and_count(text, stop_words=STOP_WORDS, hmm=True):
+    """
+    对已清洗的文本分词，过滤单字、纯数字和停用词后统计词频
+    :param text: 已清洗的文本
+    :param stop_words: 停用词集合，默认使用本模块的STOP_WORDS
+    :param hmm: 是否启用HMM新词发现
+    :return: 有效词汇的词频Counter
+    """
+    # 先由Counter在C层统计全部分词结果，再只对去重后的词汇表做过滤（词汇数远小于词数）
+    # jieba.cut返回生成器，边分词边计数，不生成完整的分词列表
+    word_counter = Counter(jieba.cut(text, HMM=hmm))
+    invalid_words = [
+        word for word in word_counter
+        # 纯数字判断先看首字符：绝大多数词首字符不是数字，无需扫描整个词
+        if len(word) <= 1 or word in stop_words or (word[0].isdecimal() and word.isdecimal())
+    ]
+    for word in invalid_words:
+        del word_counter[word]
+    return word_counter
 
 # 4. 分词并统计词频，返回TOP N高频词和完整词频字典
-def analyze_word_frequency(text, top_n=20):
+def analyze_word_frequency(texts, top_n=20):
     """
     对清洗后的整站文本分词、过滤无意义词汇、统计词频
+    :param texts: 清洗后的文本（str），或逐块产出文本的可迭代对象
+    :param top_n: 返回的高频词数量
+    :return: TOP N高频词列表，完整词频Counter
     """
-    if not text:
-        print("警告：无有效文本可供分词统计")
-        return [], {}
-    
-    # 使用jieba精确模式分词
-    word_list = jieba.lcut(text)
+    if isinstance(texts, str):
+        texts = [texts]
     
-    # 增强过滤：加入停用词过滤（适配整站文本的噪音）
-    filtered_words = []
-    for word in word_list:
-        if len(word) > 1 and not word.isdigit() and word not in STOP_WORDS:
-            filtered_words.append(word)
+    # 使用jieba精确模式逐块分词，过滤无意义词汇后累加词频
+    word_counter = Counter()
+    for text in texts:
+        word_counter.update(tokenize_and_count(text))
     
-    # 统计词频
-    word_counter = Counter(filtered_words)
+    # Counter本身就是dict子类，直接返回，无需再复制成dict（无有效词汇时为空列表和空Counter）
     top_words = word_counter.most_common(top_n)
-    full_word_freq = dict(word_counter)
-    return top_words, full_word_freq
+    return top_words, word_counter
+
+# 新增：单个文件读取→清洗→分词统计（模块级函数，供进程池按文件并行调用）
+def _count_one(num):
+    """
+    统计单个new{num}.txt文件的有效词频
+    :param num: 文件编号
+    :return: 有效词汇的词频Counter（读取失败时为空Counter）
+    """
+    text = _read_clean_text(num)
+    if not text:
+        return Counter()
+    return tokenize_and_count(text)
+
+# 新增：多个文件按文件并行分词，合并各文件的词频
+def count_files_word_freq(file_nums=[1, 2, 3]):
+    """
+    逐个文件读取、清洗和分词（文本量足够大时每个文件在独立进程中处理），最后按文件顺序合并词频
+    :param file_nums: 文件编号列表，默认[1,2,3]
+    :return: 所有文件合并后的词频Counter
+    """
+    processes = min(len(file_nums), os.cpu_count() or 1)
+    # 用文件字节数估算文本量（无需先读取文件，缺失文件按0计）；文件较小时进程池启动开销大于分词本身
+    paths = (Path(f"new{num}.txt") for num in file_nums)
+    total_size = sum(path.stat().st_size for path in paths if path.is_file())
+    if processes > 1 and total_size >= PARALLEL_MIN_CHARS:
+        # 各进程只回传词频Counter，文本本身不跨进程传输；map保持文件顺序，合并结果与串行一致
+        with Pool(processes) as pool:
+            counters = pool.map(_count_one, file_nums)
+    else:
+        counters = map(_count_one, file_nums)
+    
+    word_counter = Counter()
+    for counter in counters:
+        word_counter.update(counter)
+    return word_counter
 
 # 5. 格式化输出TOP N高频词
 def print_top_words(top_words):
@@ -87,26 +203,36 @@ def print_top_words(top_words):
     print("="*60)
 
 # 6. 保存分词结果及词频到words.txt文件
-def save_word_freq_to_file(full_word_freq, top_words, file_name="words.txt"):
+def save_word_freq_to_file(full_word_freq, top_words, file_name="words.txt", full_write_limit=None):
     """
     将完整词频和TOP20高频词保存到words.txt
+    :param full_word_freq: 完整词频（Counter或dict）
+    :param full_write_limit: 词频列表最多写入的词汇数，默认None（写入全部词汇）
     """
     try:
-        with open(file_name, 'w', encoding='utf-8') as f:
-            f.write("=== 整站文本分词词频统计结果 ===\n")
-            f.write(f"有效词汇总数：{len(full_word_freq)}\n\n")
-            
-            f.write("=== 词频TOP20 ===\n")
-            f.write(f"{'排名':<6}{'词汇':<12}{'出现频次':<8}\n")
-            f.write("-"*30 + "\n")
-            for idx, (word, freq) in enumerate(top_words, 1):
-                f.write(f"{idx:<6}{word:<12}{freq:<8}\n")
-            f.write("\n")
-            
-            f.write("=== 所有词汇词频（按频次降序） ===\n")
-            sorted_full_freq = sorted(full_word_freq.items(), key=lambda x: x[1], reverse=True)
-            for word, freq in sorted_full_freq:
-                f.write(f"{word:<12}{freq:<8}\n")
+        # 先在内存中生成全部行，再用1MB缓冲区一次性写入（词汇量大时避免逐行write）
+        lines = [
+            "=== 整站文本分词词频统计结果 ===\n",
+            f"有效词汇总数：{len(full_word_freq)}\n\n",
+            "=== 词频TOP20 ===\n",
+            f"{'排名':<6}{'词汇':<12}{'出现频次':<8}\n",
+            "-"*30 + "\n",
+        ]
+        lines.extend(_TOP_ROW_FMT(idx, word, freq) for idx, (word, freq) in enumerate(top_words, 1))
+        lines.append("\n")
+        
+        # 与Counter.most_common()相同的排序方式：C实现的itemgetter取代逐次调用的lambda（dict/Counter均适用）
+        if full_write_limit is None:
+            lines.append("=== 所有词汇词频（按频次降序） ===\n")
+            sorted_full_freq = sorted(full_word_freq.items(), key=itemgetter(1), reverse=True)
+        else:
+            # 只写前N个词汇时用堆选出TOP N，无需对整个词汇表排序
+            lines.append(f"=== 词频最高的{full_write_limit}个词汇（按频次降序） ===\n")
+            sorted_full_freq = nlargest(full_write_limit, full_word_freq.items(), key=itemgetter(1))
+        lines.extend(starmap(_ROW_FMT, sorted_full_freq))
+        
+        with open(file_name, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(lines)
         
         print(f"\n成功将分词结果及词频保存到：{file_name}")
     except IOError as e:
@@ -115,17 +241,16 @@ def save_word_freq_to_file(full_word_freq, top_words, file_name="words.txt"):
 # 7. 统一处理函数（供app.py调用）
 def process_text(file_nums=[1,2,3], top_n=20):
     """
-    统一的文本处理入口：读取→清洗→分词→统计→保存
+    统一的文本处理入口：读取→清洗→分词→统计→保存（多个文件按文件并行处理）
     """
-    raw_text = read_text_files(file_nums)
-    if not raw_text:
+    word_counter = count_files_word_freq(file_nums)
+    if not word_counter:
+        print("警告：无有效文本可供分词统计")
         return [], {}
-    text_without_html = remove_html_tags(raw_text)
-    clean_text = remove_punctuation(text_without_html)
-    top_words, full_word_freq = analyze_word_frequency(clean_text, top_n)
-    save_word_freq_to_file(full_word_freq, top_words)
+    top_words = word_counter.most_common(top_n)
+    save_word_freq_to_file(word_counter, top_words)
     print_top_words(top_words)
-    return top_words, full_word_freq
+    return top_words, word_counter
 
 # 主程序执行
 if __name__ == "__main__":